@@ -1,26 +1,30 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 import pandas as pd
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 import json
-import io
+import re
+import functools
 import sqlite3
 import hashlib
+import hmac
 import os
-import traceback
-import math
+import threading
+import queue
+import atexit
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 # Import SS-FV Calculator
 from ssfv_calculator import SmartNumberCalculator
 
+logger = logging.getLogger(__name__)
+
 # Page setup
 st.set_page_config(
     page_title="Swagelok Orders Manager", 
@@ -28,28 +32,6 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS for better styling
-st.markdown("""
-<style>
-.success-action {
-    background-color: #e8f5e8 !important;
-    border: 2px solid #4caf50 !important;
-    border-radius: 8px !important;
-    padding: 8px !important;
-    text-align: center !important;
-    font-weight: bold !important;
-    color: #2e7d32 !important;
-}
-.modal-container {
-    border: 3px solid #4CAF50;
-    border-radius: 10px;
-    padding: 20px;
-    background-color: #f0f8f0;
-    margin: 10px 0;
-}
-</style>
-""", unsafe_allow_html=True)
-
 # Your API configurations
 try:
     API_TOKEN = st.secrets["FULCRUM_API_TOKEN"]
@@ -140,62 +122,86 @@ def protect_session_state():
 initialize_session_state()
 
 # ====== DATABASE MANAGEMENT WITH GITHUB REPO BACKUP ======
+# scrypt cost parameters for stored password hashes (~16 MB, tens of ms per hash)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+
 class UserDatabase:
     """Handles persistent user storage with SQLite and GitHub repo backup"""
     
     def __init__(self, db_path="swagelok_users.db", repo_backup_path="users_backup.json"):
         self.db_path = db_path
         self.repo_backup_path = repo_backup_path
+        # Idle connections kept open between calls instead of reconnecting each time
+        self.idle_connections = queue.Queue(maxsize=8)
+        self.backup_timer = None
+        self.backup_lock = threading.Lock()
         self.init_database()
     
+    def _open_connection(self):
+        """Open a connection that any of Streamlit's threads can use"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=5)
+        # WAL lets logins and user lists read while another session writes
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    def acquire_connection(self):
+        """Borrow an idle connection, opening a new one if none is free"""
+        try:
+            return self.idle_connections.get_nowait()
+        except queue.Empty:
+            return self._open_connection()
+    
+    def release_connection(self, conn):
+        """Hand a connection back, closing it if enough are already idle"""
+        try:
+            # Whatever the caller left uncommitted is dropped here
+            conn.rollback()
+        except sqlite3.Error:
+            conn.close()
+            return
+        try:
+            self.idle_connections.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+    
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for a with block, handing it back even if the block raises"""
+        conn = self.acquire_connection()
+        try:
+            yield conn
+        finally:
+            self.release_connection(conn)
+    
     def init_database(self):
         """Initialize database and load from repo backup if available"""
         # Try to load from repo backup file first
         if os.path.exists(self.repo_backup_path):
             self.load_from_repo_backup()
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Create users table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS users (
-                username TEXT PRIMARY KEY,
-                first_name TEXT NOT NULL,
-                last_name TEXT NOT NULL,
-                password_hash TEXT NOT NULL,
-                is_admin BOOLEAN DEFAULT FALSE,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_login TIMESTAMP
-            )
-        ''')
-        
-        # Always ensure admin user exists
-        admin_password_hash = self.hash_password("swagelok2025")
-        cursor.execute('''
-            INSERT OR REPLACE INTO users (username, first_name, last_name, password_hash, is_admin, created_at)
-            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-        ''', ("mstkhan", "Muhammad", "Khan", admin_password_hash, True))
-        
-        conn.commit()
-        conn.close()
-        
-        # Update repo backup after ensuring admin exists
-        self.create_repo_backup()
-    
-    def load_from_repo_backup(self):
-        """Load user data from repo backup file"""
-        try:
-            with open(self.repo_backup_path, 'r') as f:
-                backup_data = json.load(f)
-            
-            if not backup_data.get("users"):
-                return False
-                
-            conn = sqlite3.connect(self.db_path)
+        with self.connection() as conn:
             cursor = conn.cursor()
             
-            # Create table if not exists
+            # Ensure the admin user exists, reseeding only when it is missing or
+            # broken so a restart doesn't rehash it with a fresh salt. The check
+            # and the hashing run before BEGIN so the write lock isn't held for them
+            try:
+                admin = cursor.execute(
+                    "SELECT password_hash, is_admin FROM users WHERE username = ?", ("mstkhan",)
+                ).fetchone()
+            except sqlite3.OperationalError:
+                # First start, the users table doesn't exist yet
+                admin = None
+            admin_seeded = not admin or not admin[1] or not self.verify_password("swagelok2025", admin[0])
+            admin_hash = self.hash_password("swagelok2025") if admin_seeded else None
+            
+            # Schema and admin seed commit together as one transaction
+            cursor.execute("BEGIN")
+            
+            # Create users table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS users (
                     username TEXT PRIMARY KEY,
@@ -208,25 +214,66 @@ class UserDatabase:
                 )
             ''')
             
-            # Load users from backup
-            for user in backup_data["users"]:
+            # The user list and backup are both read newest first
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_created ON users(created_at DESC)")
+            
+            if admin_seeded:
                 cursor.execute('''
+                    INSERT OR REPLACE INTO users (username, first_name, last_name, password_hash, is_admin, created_at)
+                    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ''', ("mstkhan", "Muhammad", "Khan", admin_hash, True))
+            
+            conn.commit()
+        
+        # The tracked backup file is only rewritten when the seed changed a row
+        if admin_seeded:
+            self.create_repo_backup()
+    
+    def load_from_repo_backup(self):
+        """Load user data from repo backup file"""
+        try:
+            with open(self.repo_backup_path, 'r') as f:
+                backup_data = json.load(f)
+            
+            if not backup_data.get("users"):
+                return False
+                
+            with self.connection() as conn:
+                cursor = conn.cursor()
+            
+                # Create table if not exists
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS users (
+                        username TEXT PRIMARY KEY,
+                        first_name TEXT NOT NULL,
+                        last_name TEXT NOT NULL,
+                        password_hash TEXT NOT NULL,
+                        is_admin BOOLEAN DEFAULT FALSE,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        last_login TIMESTAMP
+                    )
+                ''')
+            
+                # Load users from backup in one batched statement
+                cursor.executemany('''
                     INSERT OR REPLACE INTO users 
                     (username, first_name, last_name, password_hash, is_admin, created_at, last_login)
                     VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    user["username"],
-                    user["first_name"], 
-                    user["last_name"],
-                    user["password_hash"],
-                    user["is_admin"],
-                    user.get("created_at"),
-                    user.get("last_login")
-                ))
+                ''', [
+                    (
+                        user["username"],
+                        user["first_name"], 
+                        user["last_name"],
+                        user["password_hash"],
+                        user["is_admin"],
+                        user.get("created_at"),
+                        user.get("last_login")
+                    )
+                    for user in backup_data["users"]
+                ])
             
-            conn.commit()
-            conn.close()
-            return True
+                conn.commit()
+                return True
             
         except Exception as e:
             return False
@@ -234,19 +281,19 @@ class UserDatabase:
     def create_repo_backup(self):
         """Create backup file that can be committed to repo"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
             
-            users = cursor.execute('''
-                SELECT username, first_name, last_name, password_hash, is_admin, created_at, last_login
-                FROM users ORDER BY created_at DESC
-            ''').fetchall()
+                users = cursor.execute('''
+                    SELECT username, first_name, last_name, password_hash, is_admin, created_at, last_login
+                    FROM users ORDER BY created_at DESC
+                ''').fetchall()
             
             backup_data = {
                 "backup_timestamp": datetime.now().isoformat(),
                 "users": []
             }
-            
+        
             for user in users:
                 backup_data["users"].append({
                     "username": user[0],
@@ -257,16 +304,33 @@ class UserDatabase:
                     "created_at": user[5],
                     "last_login": user[6]
                 })
-            
-            with open(self.repo_backup_path, 'w') as f:
-                json.dump(backup_data, f, indent=2)
-            
-            conn.close()
+        
+            # Write then swap so a crash never leaves a truncated backup
+            temp_path = f"{self.repo_backup_path}.tmp"
+            with open(temp_path, 'w') as f:
+                # One serialised string and one write, not a write per JSON token
+                f.write(json.dumps(backup_data, indent=2))
+            os.replace(temp_path, self.repo_backup_path)
+        
             return backup_data
-            
+        
         except Exception as e:
             return None
     
+    def schedule_repo_backup(self, delay=5.0):
+        """Write the repo backup shortly, folding a burst of changes into one write"""
+        with self.backup_lock:
+            if self.backup_timer is None:
+                # Not a daemon, so a pending backup still lands when the server stops
+                self.backup_timer = threading.Timer(delay, self._flush_repo_backup)
+                self.backup_timer.start()
+    
+    def _flush_repo_backup(self):
+        """Run the scheduled backup"""
+        with self.backup_lock:
+            self.backup_timer = None
+        self.create_repo_backup()
+    
     def get_backup_download(self):
         """Get backup data for download"""
         backup_data = self.create_repo_backup()
@@ -275,34 +339,46 @@ class UserDatabase:
         return None
     
     def hash_password(self, password):
-        """Hash password using SHA-256"""
-        return hashlib.sha256(password.encode()).hexdigest()
+        """Hash password with salted scrypt"""
+        salt = os.urandom(16)
+        derived = hashlib.scrypt(password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
+        return f"scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}${salt.hex()}${derived.hex()}"
     
     def verify_password(self, password, password_hash):
-        """Verify password against hash"""
-        return self.hash_password(password) == password_hash
+        """Verify password against hash in constant time"""
+        if password_hash.startswith("scrypt$"):
+            try:
+                _, n, r, p, salt, expected = password_hash.split("$")
+                derived = hashlib.scrypt(
+                    password.encode(), salt=bytes.fromhex(salt), n=int(n), r=int(r), p=int(p)
+                )
+            except ValueError:
+                return False
+            return hmac.compare_digest(derived.hex(), expected)
+        
+        # Unsalted SHA-256 hashes from older backups; replaced on next login
+        legacy_hash = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(legacy_hash, password_hash)
     
     def create_user(self, username, first_name, last_name, password, is_admin=False):
         """Create new user and update repo backup"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
             
-            if cursor.execute("SELECT username FROM users WHERE username = ?", (username,)).fetchone():
-                conn.close()
-                return False, "Username already exists"
+                if cursor.execute("SELECT username FROM users WHERE username = ?", (username,)).fetchone():
+                    return False, "Username already exists"
             
-            password_hash = self.hash_password(password)
-            cursor.execute('''
-                INSERT INTO users (username, first_name, last_name, password_hash, is_admin)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (username, first_name, last_name, password_hash, is_admin))
+                password_hash = self.hash_password(password)
+                cursor.execute('''
+                    INSERT INTO users (username, first_name, last_name, password_hash, is_admin)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (username, first_name, last_name, password_hash, is_admin))
             
-            conn.commit()
-            conn.close()
+                conn.commit()
             
-            self.create_repo_backup()
-            return True, "User created successfully"
+                self.schedule_repo_backup()
+                return True, "User created successfully"
             
         except Exception as e:
             return False, f"Database error: {str(e)}"
@@ -310,33 +386,35 @@ class UserDatabase:
     def authenticate_user(self, username, password):
         """Authenticate user login"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
             
-            user = cursor.execute('''
-                SELECT username, first_name, last_name, password_hash, is_admin
-                FROM users WHERE username = ?
-            ''', (username,)).fetchone()
+                user = cursor.execute('''
+                    SELECT username, first_name, last_name, password_hash, is_admin
+                    FROM users WHERE username = ?
+                ''', (username,)).fetchone()
             
-            if user and self.verify_password(password, user[3]):
-                cursor.execute(
-                    "UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE username = ?",
-                    (username,)
-                )
-                conn.commit()
-                conn.close()
+                if user and self.verify_password(password, user[3]):
+                    # Legacy SHA-256 hashes are upgraded in the same statement as last_login
+                    upgraded_hash = None if user[3].startswith("scrypt$") else self.hash_password(password)
+                    cursor.execute(
+                        "UPDATE users SET last_login = CURRENT_TIMESTAMP, password_hash = COALESCE(?, password_hash) WHERE username = ?",
+                        (upgraded_hash, username)
+                    )
+                    conn.commit()
                 
-                self.create_repo_backup()
+                    # Back up the new hash so a restore doesn't bring the old one back
+                    if upgraded_hash:
+                        self.schedule_repo_backup()
                 
-                return True, {
-                    'username': user[0],
-                    'first_name': user[1],
-                    'last_name': user[2],
-                    'is_admin': bool(user[4])
-                }
-            else:
-                conn.close()
-                return False, "Invalid credentials"
+                    return True, {
+                        'username': user[0],
+                        'first_name': user[1],
+                        'last_name': user[2],
+                        'is_admin': bool(user[4])
+                    }
+                else:
+                    return False, "Invalid credentials"
             
         except Exception as e:
             return False, f"Database error: {str(e)}"
@@ -344,28 +422,26 @@ class UserDatabase:
     def change_password(self, username, old_password, new_password):
         """Change user password"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
             
-            user = cursor.execute(
-                "SELECT password_hash FROM users WHERE username = ?", (username,)
-            ).fetchone()
+                user = cursor.execute(
+                    "SELECT password_hash FROM users WHERE username = ?", (username,)
+                ).fetchone()
             
-            if not user or not self.verify_password(old_password, user[0]):
-                conn.close()
-                return False, "Current password is incorrect"
+                if not user or not self.verify_password(old_password, user[0]):
+                    return False, "Current password is incorrect"
             
-            new_password_hash = self.hash_password(new_password)
-            cursor.execute(
-                "UPDATE users SET password_hash = ? WHERE username = ?",
-                (new_password_hash, username)
-            )
+                new_password_hash = self.hash_password(new_password)
+                cursor.execute(
+                    "UPDATE users SET password_hash = ? WHERE username = ?",
+                    (new_password_hash, username)
+                )
             
-            conn.commit()
-            conn.close()
+                conn.commit()
             
-            self.create_repo_backup()
-            return True, "Password changed successfully"
+                self.schedule_repo_backup()
+                return True, "Password changed successfully"
             
         except Exception as e:
             return False, f"Database error: {str(e)}"
@@ -373,16 +449,15 @@ class UserDatabase:
     def get_all_users(self):
         """Get all users"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self.connection() as conn:
+                cursor = conn.cursor()
             
-            users = cursor.execute('''
-                SELECT username, first_name, last_name, is_admin, created_at, last_login
-                FROM users ORDER BY created_at DESC
-            ''').fetchall()
+                users = cursor.execute('''
+                    SELECT username, first_name, last_name, is_admin, created_at, last_login
+                    FROM users ORDER BY created_at DESC
+                ''').fetchall()
             
-            conn.close()
-            return users
+                return users
             
         except Exception as e:
             return []
@@ -392,33 +467,59 @@ class UserDatabase:
 def get_user_db():
     return UserDatabase()
 
+@st.cache_data(ttl=60, show_spinner=False)
+def get_user_list():
+    """All user rows for the admin list, re-read at most once a minute"""
+    return get_user_db().get_all_users()
+
 # Business Logic Functions
 def business_days_from(start_date, days):
     """Calculate business days from start date (excluding weekends)"""
-    current_date = start_date
-    days_added = 0
-    
-    while days_added < days:
-        current_date += timedelta(days=1)
-        if current_date.weekday() < 5:  # Monday=0, Sunday=6
-            days_added += 1
+    if days <= 0:
+        return start_date
     
-    return current_date
+    # The time of day is kept as is; only the calendar shift is looked up
+    return start_date + timedelta(days=_business_day_shift(start_date.date(), days))
+
+@functools.lru_cache(maxsize=4096)
+def _business_day_shift(start_day, days):
+    """Calendar days between start_day and the date `days` business days later"""
+    # Rolling back first makes a weekend start count from the Friday before,
+    # matching the old day-by-day walk
+    start = np.datetime64(start_day, 'D')
+    end = np.busday_offset(start, days, roll='backward')
+    return int((end - start).astype(int))
 
+DATE_FORMATS = ("%m/%d/%Y", "%Y-%m-%d", "%m-%d-%Y", "%d/%m/%Y")
+US_DATE_PATTERN = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+
+@functools.lru_cache(maxsize=4096)
 def parse_date_safely(date_str):
     """Safely parse date string in various formats"""
     if not date_str or date_str in ["TBD", "Delivered", ""]:
         return None
     
-    date_formats = ["%m/%d/%Y", "%Y-%m-%d", "%m-%d-%Y", "%d/%m/%Y"]
+    date_text = str(date_str).strip()
     
-    for fmt in date_formats:
+    # Portal dates are nearly always MM/DD/YYYY, so build those without strptime
+    match = US_DATE_PATTERN.fullmatch(date_text)
+    if match:
+        month, day, year = map(int, match.groups())
         try:
-            return datetime.strptime(str(date_str).strip(), fmt)
+            return datetime(year, month, day)
+        except ValueError:
+            pass
+    
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_text, fmt)
         except ValueError:
             continue
     
-    return None
+    try:
+        return datetime.fromisoformat(date_text)
+    except ValueError:
+        return None
 
 def format_delivery_date(date_input):
     """Format delivery date for API consumption"""
@@ -435,7 +536,48 @@ def format_delivery_date(date_input):
         calculated_date = business_days_from(datetime.now(), 18)
         return calculated_date.strftime("%Y-%m-%d")
     
+# Errors raised on run_concurrently workers, held until the caller can show them
+_worker_errors = threading.local()
+
+def report_error(message):
+    """Show an error on the page, or hold it when raised off the script thread"""
+    held = getattr(_worker_errors, "messages", None)
+    if held is not None:
+        held.append(message)
+    elif get_script_run_ctx(suppress_warning=True) is None:
+        # Background jobs have no page to write to
+        logger.warning(message)
+    else:
+        st.error(message)
+
+def run_concurrently(func, items, max_workers=8):
+    """Run func over items on worker threads and return results in input order"""
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    
+    # Workers never touch Streamlit; their errors come back with the results
+    def run(item):
+        _worker_errors.messages = []
+        try:
+            return func(item), _worker_errors.messages
+        finally:
+            _worker_errors.messages = None
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        outcomes = list(executor.map(run, items))
+    
+    for _, messages in outcomes:
+        for message in messages:
+            report_error(message)
+    return [result for result, _ in outcomes]
+    
 # ====== ENHANCED API CLIENT WITH SS-FV INTEGRATION ======
+# Seconds to trust a "no such item" answer before asking Fulcrum again
+ITEM_MISS_TTL = 60
+# Longest single wait on a rate-limited (429) response
+MAX_RETRY_WAIT = 30
+
 class OptimizedFulcrumAPI:
     """Enhanced API client with BOM, operations, and SS-FV calculator integration"""
     
@@ -448,30 +590,36 @@ class OptimizedFulcrumAPI:
         }
         self.base_url = BASE_URL
         self.item_cache = {}
+        self.item_misses = {}
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+        # Keep TLS connections to Fulcrum open between calls; retries stay in _make_request.
+        # The client is shared by every session, so leave room for concurrent workflows
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        self.session.mount("https://", adapter)
         
     def _make_request(self, method, url, payload=None, max_retries=3):
         """Generic method with retry logic and better error handling"""
+        method = method.upper()
+        if method not in ("GET", "POST", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
         for attempt in range(max_retries):
             try:
-                if method.upper() == "GET":
-                    response = self.session.get(url, timeout=30)
-                elif method.upper() == "POST":
-                    response = self.session.post(url, json=payload, timeout=30)
-                elif method.upper() == "DELETE":
-                    response = self.session.delete(url, timeout=30)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+                response = self.session.request(
+                    method, url, json=payload if method == "POST" else None, timeout=30
+                )
                 
                 if response.status_code in [200, 201, 204]:
                     return response.json() if response.content else {}
                 elif response.status_code == 429:
-                    wait_time = 2 ** attempt
-                    time.sleep(wait_time)
+                    # Wait as long as Fulcrum asks, falling back to exponential backoff
+                    retry_after = response.headers.get("Retry-After", "")
+                    wait_time = int(retry_after) if retry_after.isdigit() else 2 ** attempt
+                    time.sleep(min(wait_time, MAX_RETRY_WAIT))
                     continue
                 else:
-                    st.error(f"API Error {response.status_code}: {response.text}")
+                    report_error(f"API Error {response.status_code}: {response.text}")
                     return None
                     
             except requests.exceptions.Timeout:
@@ -484,10 +632,16 @@ class OptimizedFulcrumAPI:
         
         return None
     
+    def _recently_missing(self, item_name):
+        """True if Fulcrum reported no such item within the last ITEM_MISS_TTL seconds"""
+        return time.time() - self.item_misses.get(item_name, 0) < ITEM_MISS_TTL
+    
     def check_item_exists(self, part_number):
         """Check if item exists and return its ID with caching"""
         if part_number in self.item_cache:
             return self.item_cache[part_number]
+        if self._recently_missing(part_number):
+            return None
             
         url = f"{self.base_url}/items/list/v2"
         payload = {
@@ -501,7 +655,8 @@ class OptimizedFulcrumAPI:
             self.item_cache[part_number] = item_id
             return item_id
         
-        self.item_cache[part_number] = None
+        # Misses expire so items created outside the app are picked up
+        self.item_misses[part_number] = time.time()
         return None
     
     def create_item(self, part_number, description, price=None):
@@ -534,6 +689,8 @@ class OptimizedFulcrumAPI:
         """Get item ID by name with caching"""
         if item_name in self.item_cache:
             return self.item_cache[item_name]
+        if self._recently_missing(item_name):
+            return None
             
         url = f"{self.base_url}/items/list/v2"
         payload = {
@@ -548,9 +705,33 @@ class OptimizedFulcrumAPI:
                 self.item_cache[item_name] = item_id
                 return item_id
         
-        self.item_cache[item_name] = None
+        self.item_misses[item_name] = time.time()
         return None
 
+    def lookup_item_ids(self, item_names):
+        """Look up many item numbers in one request and return {name: id or None}"""
+        pending = [
+            name for name in dict.fromkeys(item_names)
+            if name not in self.item_cache and not self._recently_missing(name)
+        ]
+        
+        if pending:
+            url = f"{self.base_url}/items/list/v2"
+            payload = {
+                "numbers": [{"query": name, "mode": "equal"} for name in pending],
+                "latestRevision": True
+            }
+            
+            response_data = self._make_request("POST", url, payload)
+            if response_data and isinstance(response_data, list):
+                pending_names = set(pending)
+                for item in response_data:
+                    if item.get("number") in pending_names and "id" in item:
+                        self.item_cache[item["number"]] = item["id"]
+        
+        # Misses stay uncached so single lookups can still confirm them
+        return {name: self.item_cache.get(name) for name in item_names}
+
     def list_input_items(self, item_id, bom_name=""):
         """List all input items (BOM items) for an item"""
         url = f"{self.base_url}/items/{item_id}/routing/input-items/list"
@@ -585,19 +766,15 @@ class OptimizedFulcrumAPI:
 
     def clear_item_routing(self, item_id, first_bom_name=""):
         """Clear all routing (BOM and operations) for an item"""
-        input_items = self.list_input_items(item_id, first_bom_name)
-        deleted_inputs = 0
-        for item in input_items:
-            if "id" in item:
-                if self.delete_input_item(item_id, item["id"]):
-                    deleted_inputs += 1
-        
-        operations = self.list_operations(item_id, first_bom_name)
-        deleted_operations = 0
-        for op in operations:
-            if "id" in op:
-                if self.delete_operation(item_id, op["id"]):
-                    deleted_operations += 1
+        # Listing and deleting are independent calls, so overlap their round-trips
+        input_items, operations = run_concurrently(
+            lambda list_routing: list_routing(item_id, first_bom_name),
+            [self.list_input_items, self.list_operations]
+        )
+        
+        deletions = [(self.delete_input_item, item["id"]) for item in input_items if "id" in item]
+        deletions += [(self.delete_operation, op["id"]) for op in operations if "id" in op]
+        run_concurrently(lambda deletion: deletion[0](item_id, deletion[1]), deletions)
         
         return True
 
@@ -636,7 +813,8 @@ class OptimizedFulcrumAPI:
         """Upload file attachment to sales order"""
         try:
             attachment_url = f"{self.base_url}/attachments"
-            headers = {"Authorization": f"Bearer {self.api_token}"}
+            # Let requests set the multipart Content-Type instead of the session's JSON one
+            headers = {"Content-Type": None}
             
             attachment_payload = {
                 "Detail.Owner.Type": "salesOrder",
@@ -648,7 +826,7 @@ class OptimizedFulcrumAPI:
             
             files = {"File": (uploaded_file.name, uploaded_file.getvalue(), uploaded_file.type)}
             
-            response = requests.post(
+            response = self.session.post(
                 attachment_url, 
                 headers=headers, 
                 data=attachment_payload, 
@@ -700,6 +878,18 @@ class OptimizedFulcrumAPI:
 def get_api_client():
     return OptimizedFulcrumAPI(API_TOKEN)
 
+@st.cache_resource
+def get_lookup_executor():
+    """One thread for background Fulcrum lookups, kept apart from the portal scrapes"""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="fulcrum-lookup")
+
+def warm_item_cache(api_client, part_numbers):
+    """Look up fetched part numbers ahead of time so SO creation finds them cached"""
+    try:
+        api_client.lookup_item_ids(part_numbers)
+    except Exception as e:
+        logger.warning(f"Item cache warm-up failed: {str(e)}")
+
 # ====== SS-FV CALCULATOR INTEGRATION ======
 @st.cache_resource
 def get_ssfv_calculator():
@@ -752,7 +942,7 @@ def convert_ssfv_to_fulcrum_format(ssfv_result):
         return bom_items, operations, description, price
         
     except Exception as e:
-        st.error(f"Error converting SS-FV results: {str(e)}")
+        report_error(f"Error converting SS-FV results: {str(e)}")
         return [], [], "", 0.0
 
 def process_part_number_with_ssfv(part_number, manual_price=None):
@@ -763,13 +953,12 @@ def process_part_number_with_ssfv(part_number, manual_price=None):
     api_client = get_api_client()
     
     try:
-        existing_item_id = api_client.check_item_exists(part_number)
-        
         if part_number.startswith("SS-FV"):
             success, ssfv_result, error_msg = process_ssfv_part_number(part_number)
             
             if not success:
                 if manual_price is not None:
+                    existing_item_id = api_client.check_item_exists(part_number)
                     if existing_item_id:
                         item_id = existing_item_id
                     else:
@@ -795,6 +984,9 @@ def process_part_number_with_ssfv(part_number, manual_price=None):
             bom_items = []
             operations = []
         
+        # Looked up only once the price checks pass, so a part that can't be
+        # priced returns without a Fulcrum round-trip
+        existing_item_id = api_client.check_item_exists(part_number)
         if existing_item_id:
             item_id = existing_item_id
             
@@ -807,6 +999,8 @@ def process_part_number_with_ssfv(part_number, manual_price=None):
                 return None, final_price, False, f"Failed to create item for {part_number}", bom_items, operations
         
         if bom_items:
+            # Resolve every BOM component in one request before adding them
+            api_client.lookup_item_ids([bom_item["name"] for bom_item in bom_items])
             for bom_item in bom_items:
                 bom_id = api_client.get_item_id(bom_item["name"])
                 if bom_id:
@@ -823,13 +1017,14 @@ def process_part_number_with_ssfv(part_number, manual_price=None):
     except Exception as e:
         return None, None, False, f"Error processing part {part_number}: {str(e)}", [], []
 
-def create_sales_order_workflow(order_row, delivery_date=None, manual_price=None, skip_processing=False, uploaded_file=None):
+def submit_sales_order(order_row, delivery_date=None, manual_price=None, skip_processing=False, uploaded_file=None, on_step=None):
     """
-    Complete SO creation workflow with proper error handling
+    Create the Sales Order in Fulcrum without touching the page or session state
+    Returns: (so_number, message, warnings)
     """
     api_client = get_api_client()
-    
-    progress_placeholder = st.empty()
+    show_step = on_step or (lambda text, progress: None)
+    warnings = []
     
     try:
         order_number = str(order_row[0]).strip()
@@ -837,116 +1032,154 @@ def create_sales_order_workflow(order_row, delivery_date=None, manual_price=None
         part_number = str(order_row[2]).strip()
         quantity = int(order_row[3])
         
-        with progress_placeholder.container():
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            # Step 1: Check if item exists
-            status_text.text("🔍 Checking if item exists...")
-            progress_bar.progress(0.2)
+        # Step 1: Check if item exists
+        show_step("🔍 Checking if item exists...", 0.2)
+        
+        if skip_processing:
+            if manual_price is None:
+                return None, "Manual price is required when skipping processing", warnings
             
-            if skip_processing:
-                if manual_price is None:
-                    return None, "Manual price is required when skipping processing"
-                
-                existing_item_id = api_client.check_item_exists(part_number)
-                if existing_item_id:
-                    item_id = existing_item_id
-                else:
-                    item_id = api_client.create_item(part_number, f"Swagelok Part {part_number}")
-                
-                price = manual_price
+            existing_item_id = api_client.check_item_exists(part_number)
+            if existing_item_id:
+                item_id = existing_item_id
             else:
-                # Full SS-FV processing
-                status_text.text("📊 Processing part details...")
-                progress_bar.progress(0.3)
-                
-                item_id, price, success, error_msg, bom_items, operations = process_part_number_with_ssfv(part_number, manual_price)
-                if not success:
-                    return None, error_msg
-                if price is None:
-                    return None, "Price is required to create Sales Order"
-            
-            # Step 2: Create Sales Order
-            status_text.text("📋 Creating sales order...")
-            progress_bar.progress(0.5)
+                item_id = api_client.create_item(part_number, f"Swagelok Part {part_number}")
             
-            if delivery_date:
-                due_date_final = format_delivery_date(delivery_date)
-            else:
-                order_dt = parse_date_safely(order_date)
-                if order_dt:
-                    calculated_date = business_days_from(order_dt, 18)
-                    due_date_final = calculated_date.strftime("%Y-%m-%d")
-                else:
-                    calculated_date = business_days_from(datetime.now(), 18)
-                    due_date_final = calculated_date.strftime("%Y-%m-%d")
+            price = manual_price
+        else:
+            # Full SS-FV processing
+            show_step("📊 Processing part details...", 0.3)
             
+            item_id, price, success, error_msg, bom_items, operations = process_part_number_with_ssfv(part_number, manual_price)
+            if not success:
+                return None, error_msg, warnings
+            if price is None:
+                return None, "Price is required to create Sales Order", warnings
+        
+        # Step 2: Create Sales Order
+        show_step("📋 Creating sales order...", 0.5)
+        
+        if delivery_date:
+            due_date_final = format_delivery_date(delivery_date)
+        else:
             order_dt = parse_date_safely(order_date)
             if order_dt:
-                order_date_final = order_dt.strftime("%Y-%m-%d")
+                calculated_date = business_days_from(order_dt, 18)
+                due_date_final = calculated_date.strftime("%Y-%m-%d")
             else:
-                order_date_final = datetime.now().strftime("%Y-%m-%d")
-            
-            payload = {
-                "customerId": "654241f9c77f04d8d76410c4",
-                "customerPoNumber": order_number,
-                "orderedDate": order_date_final,
-                "contact": {"firstName": "Kristian", "lastName": "Barnett"},
-                "dueDate": due_date_final,
-            }
-            
-            sales_order_id = api_client.create_sales_order(payload)
-            
-            if not sales_order_id:
-                return None, "Failed to create Sales Order"
-            
-            # Get SO number
-            so_details = api_client.get_sales_order_details(sales_order_id)
-            sales_order_number = so_details.get("number") if so_details else "Unknown"
-            
-            # Step 3: Add line item
-            status_text.text("➕ Adding line items...")
-            progress_bar.progress(0.7)
-            
-            if item_id and price is not None:
-                success = api_client.add_part_line_item(sales_order_id, item_id, quantity, price)
-                
-                if not success:
-                    return None, "Failed to add line item to Sales Order"
-            
-            # Step 4: Handle attachment if provided
-            if uploaded_file:
-                status_text.text("📎 Uploading attachment...")
-                progress_bar.progress(0.9)
+                calculated_date = business_days_from(datetime.now(), 18)
+                due_date_final = calculated_date.strftime("%Y-%m-%d")
+        
+        order_dt = parse_date_safely(order_date)
+        if order_dt:
+            order_date_final = order_dt.strftime("%Y-%m-%d")
+        else:
+            order_date_final = datetime.now().strftime("%Y-%m-%d")
+        
+        payload = {
+            "customerId": "654241f9c77f04d8d76410c4",
+            "customerPoNumber": order_number,
+            "orderedDate": order_date_final,
+            "contact": {"firstName": "Kristian", "lastName": "Barnett"},
+            "dueDate": due_date_final,
+        }
+        
+        sales_order_id = api_client.create_sales_order(payload)
+        
+        if not sales_order_id:
+            return None, "Failed to create Sales Order", warnings
+        
+        # Step 3: SO number, line item and attachment only need the SO id, so send them together
+        show_step("➕ Adding line items...", 0.7)
+        
+        tasks = {"details": lambda: api_client.get_sales_order_details(sales_order_id)}
+        if item_id and price is not None:
+            tasks["line_item"] = lambda: api_client.add_part_line_item(sales_order_id, item_id, quantity, price)
+        if uploaded_file:
+            tasks["attachment"] = lambda: api_client.upload_attachment(sales_order_id, uploaded_file, order_number)
+        
+        results = dict(zip(tasks, run_concurrently(lambda task: task(), tasks.values())))
+        
+        so_details = results["details"]
+        sales_order_number = so_details.get("number") if so_details else "Unknown"
+        
+        if "line_item" in results and not results["line_item"]:
+            return None, "Failed to add line item to Sales Order", warnings
+        
+        if "attachment" in results and not results["attachment"]:
+            warnings.append("⚠️ SO created but attachment upload failed")
+        
+        return sales_order_number, "Success", warnings
                 
-                upload_success = api_client.upload_attachment(sales_order_id, uploaded_file, order_number)
-                if not upload_success:
-                    st.warning("⚠️ SO created but attachment upload failed")
-            
-            # Complete
-            status_text.text("✅ Sales order created successfully!")
-            progress_bar.progress(1.0)
+    except Exception as e:
+        return None, f"Error creating sales order: {str(e)}", warnings
+
+def create_sales_order_workflow(order_row, delivery_date=None, manual_price=None, skip_processing=False, uploaded_file=None):
+    """
+    Complete SO creation workflow with proper error handling
+    """
+    progress_placeholder = st.empty()
+    
+    try:
+        with progress_placeholder.container():
+            progress_bar = st.progress(0)
+            status_text = st.empty()
             
-            # Update session state
-            if 'created_sos' not in st.session_state:
-                st.session_state.created_sos = {}
-            st.session_state.created_sos[order_number] = sales_order_number
+            def show_step(text, progress):
+                status_text.text(text)
+                progress_bar.progress(progress)
             
-            # Store success for display
-            st.session_state.so_creation_success = {
-                'so_number': sales_order_number,
-                'order_number': order_number,
-                'timestamp': datetime.now()
-            }
+            so_number, message, warnings = submit_sales_order(
+                order_row, delivery_date, manual_price, skip_processing, uploaded_file, on_step=show_step
+            )
             
-            return sales_order_number, "Success"
-                
-    except Exception as e:
-        return None, f"Error creating sales order: {str(e)}"
+            if so_number:
+                show_step("✅ Sales order created successfully!", 1.0)
     finally:
         time.sleep(1)
         progress_placeholder.empty()
+    
+    for warning in warnings:
+        st.warning(warning)
+    
+    if so_number:
+        order_number = str(order_row[0]).strip()
+        if 'created_sos' not in st.session_state:
+            st.session_state.created_sos = {}
+        st.session_state.created_sos[order_number] = so_number
+        
+        # Store success for display
+        st.session_state.so_creation_success = {
+            'so_number': so_number,
+            'order_number': order_number,
+            'timestamp': datetime.now()
+        }
+    
+    return so_number, message
+
+def create_sales_orders_batch(orders, on_progress=None):
+    """Create Sales Orders for many (row, delivery_date) orders concurrently"""
+    # Orders for the same part go in separate rounds so its item is only created once
+    rounds = []
+    seen_parts = {}
+    for order in orders:
+        part_number = str(order[0][2]).strip()
+        round_index = seen_parts.get(part_number, 0)
+        seen_parts[part_number] = round_index + 1
+        if round_index == len(rounds):
+            rounds.append([])
+        rounds[round_index].append(order)
+    
+    # Workers only talk to Fulcrum; page and session updates are left to the caller
+    results = []
+    for batch in rounds:
+        outcomes = run_concurrently(
+            lambda order: submit_sales_order(order[0], order[1]), batch, max_workers=4
+        )
+        results.extend(zip(batch, outcomes))
+        if on_progress:
+            on_progress(len(results), len(orders))
+    return results
         
 # ====== ENHANCED SO CREATION MODAL ======
 @st.dialog("Create Sales Order", width="large")
@@ -1077,212 +1310,465 @@ def show_so_creation_modal():
             st.rerun()
 
 # ====== SWAGELOK ORDER FETCHING ======
-def fetch_swagelok_orders(selected_status):
-    """Fetch orders from Swagelok portal with improved parsing"""
-    
-    driver = None
+SWAGELOK_LOGIN_URL = "https://supplierportal.swagelok.com//login.aspx"
+ORDER_STATUSES = [
+    "Order - New, Requires Supplier Action",
+    "Order - Modification, Requires Supplier Action",
+    "Ack - Sent",
+    "Ack - Accepted",
+    "Order - History"
+]
+SWAGELOK_COOKIES_PATH = "swagelok_cookies.json"
+SELENIUM_REMOTE_URL = st.secrets.get("SELENIUM_REMOTE_URL", os.environ.get("SELENIUM_REMOTE_URL"))
+# Supplier portal account, read once from secrets or the environment
+SWAGELOK_USERNAME = st.secrets.get("SWAGELOK_USERNAME", os.environ.get("SWAGELOK_USERNAME"))
+SWAGELOK_PASSWORD = st.secrets.get("SWAGELOK_PASSWORD", os.environ.get("SWAGELOK_PASSWORD"))
+ORDER_FIRST_ROW_ID = "ctl00_MainContentPlaceHolder_rptResults_ctl01_trDetails"
+ORDER_ROWS_SCRIPT = """
+return Array.from(
+    document.querySelectorAll('tr[id^="ctl00_MainContentPlaceHolder_rptResults_"][id$="_trDetails"]')
+).map(function (row) { return row.innerText; });
+"""
+# Fill in the login form and submit it in one browser round-trip
+LOGIN_SCRIPT = """
+document.getElementById("ctl00_MainContentPlaceHolder_txtUsername").value = arguments[0];
+document.getElementById("ctl00_MainContentPlaceHolder_txtPassword").value = arguments[1];
+document.getElementById("ctl00_MainContentPlaceHolder_btnGo2").click();
+"""
+# Set the search filters and submit; returns false if the status is not in the list.
+# The filters are set as plain values with no click/change events: the status
+# dropdown posts back on change, and that deferred postback would replace the
+# Search submit. Both values still go to the server with the Search form post.
+ORDER_SEARCH_SCRIPT = """
+var status = arguments[0];
+var checkbox = document.getElementById("ctl00_MainContentPlaceHolder_chkOrdersRequiringAction");
+checkbox.checked = true;
+var dropdown = document.getElementById("ctl00_MainContentPlaceHolder_cboRequestStatus");
+var option = Array.from(dropdown.options).find(function (o) { return o.text.trim() === status; });
+if (!option) { return false; }
+dropdown.value = option.value;
+document.getElementById("ctl00_MainContentPlaceHolder_btnSearch").click();
+return true;
+"""
+
+# Probed once at import; Streamlit Cloud installs these via packages.txt
+CHROMIUM_BINARY = "/usr/bin/chromium" if os.path.exists("/usr/bin/chromium") else None
+
+@st.cache_resource
+def resolve_chromedriver():
+    """Find chromedriver once per process, downloading it only if the system one is missing"""
+    if os.path.exists("/usr/bin/chromedriver"):
+        return "/usr/bin/chromedriver"
     
-    try:
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+class SwagelokBrowser:
+    """Keeps one logged-in Chrome session alive across order fetches"""
+
+    def __init__(self, username, password):
+        self.username = username
+        self.password = password
+        self.driver = None
+        self.orders_url = None
+
+    def _create_driver(self):
+        """Start headless Chrome, preferring the system chromedriver"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+
         options = Options()
         options.add_argument('--headless=new')
-        options.add_argument('--no-sandbox') 
+        options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--single-process')
-        
-        try:
-            options.binary_location = '/usr/bin/chromium'
-        except:
-            pass
-        
-        try:
-            service = Service('/usr/bin/chromedriver')
-            driver = webdriver.Chrome(service=service, options=options)
-        except Exception as e1:
+        options.add_argument('--disable-gpu')
+        options.add_argument('--disable-extensions')
+
+        # Only the DOM is scraped - skip images and return at DOMContentLoaded
+        options.page_load_strategy = 'eager'
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_argument('--disable-features=Translate,BackForwardCache,AcceptCHFrame')
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+
+        if SELENIUM_REMOTE_URL:
+            # Shared Selenium Grid / browserless endpoint - no local Chrome process
             try:
-                service = Service(ChromeDriverManager().install())
+                driver = webdriver.Remote(command_executor=SELENIUM_REMOTE_URL, options=options)
+            except Exception as e:
+                return None
+        else:
+            if CHROMIUM_BINARY:
+                options.binary_location = CHROMIUM_BINARY
+
+            try:
+                service = Service(resolve_chromedriver())
                 driver = webdriver.Chrome(service=service, options=options)
-            except Exception as e2:
-                return [], []
-        
+            except Exception as e:
+                return None
+
         driver.set_page_load_timeout(20)
-        wait = WebDriverWait(driver, 15)
-        
-        driver.get("https://supplierportal.swagelok.com//login.aspx")
-        
-        username_field = wait.until(EC.presence_of_element_located((By.ID, "ctl00_MainContentPlaceHolder_txtUsername")))
-        password_field = wait.until(EC.presence_of_element_located((By.ID, "ctl00_MainContentPlaceHolder_txtPassword")))
-        go_button = wait.until(EC.presence_of_element_located((By.ID, "ctl00_MainContentPlaceHolder_btnGo2")))
+        # Explicit waits only - an implicit wait would stretch every find_elements miss
+        driver.implicitly_wait(0)
+        return driver
 
-        username_field.send_keys("mstkhan")
-        password_field.send_keys("Concept350!")
-        go_button.click()
+    def _login(self):
+        """Run the portal login and open the orders application window"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
 
-        try:
-            accept_terms_button = wait.until(EC.presence_of_element_located((By.ID, "ctl00_MainContentPlaceHolder_lnkAcceptTerms")))
-            accept_terms_button.click()
-        except:
-            pass
+        driver = self.driver
+        wait = WebDriverWait(driver, 15, poll_frequency=0.2)
+
+        driver.get(SWAGELOK_LOGIN_URL)
+
+        # The button comes last in the form, so the fields are there once it is
+        wait.until(EC.presence_of_element_located((By.ID, "ctl00_MainContentPlaceHolder_btnGo2")))
+        driver.execute_script(LOGIN_SCRIPT, self.username, self.password)
+
+        # The terms page only shows up sometimes - wait for whichever page loads
+        # instead of sitting out the full timeout when there are no terms
+        wait.until(EC.any_of(
+            EC.presence_of_element_located((By.ID, "ctl00_MainContentPlaceHolder_lnkAcceptTerms")),
+            EC.presence_of_element_located((By.ID, "ctl00_MainContentPlaceHolder_rptPortalApplications_ctl01_lnkPortalApplication"))
+        ))
+        accept_terms_buttons = driver.find_elements(By.ID, "ctl00_MainContentPlaceHolder_lnkAcceptTerms")
+        if accept_terms_buttons:
+            accept_terms_buttons[0].click()
 
         order_application_link = wait.until(EC.presence_of_element_located((By.ID, "ctl00_MainContentPlaceHolder_rptPortalApplications_ctl01_lnkPortalApplication")))
         order_application_link.click()
         driver.switch_to.window(driver.window_handles[-1])
 
-        checkbox = wait.until(EC.presence_of_element_located((By.ID, "ctl00_MainContentPlaceHolder_chkOrdersRequiringAction")))
-        if not checkbox.is_selected():
-            checkbox.click()
+        # Wait for the orders page before remembering where it lives
+        wait.until(EC.presence_of_element_located((By.ID, "ctl00_MainContentPlaceHolder_cboRequestStatus")))
+        self.orders_url = driver.current_url
+        self._save_session()
 
-        dropdown = wait.until(EC.presence_of_element_located((By.ID, "ctl00_MainContentPlaceHolder_cboRequestStatus")))
-        for option in dropdown.find_elements(By.TAG_NAME, "option"):
-            if option.text == selected_status:
-                option.click()
-                break
+    def _save_session(self):
+        """Keep the orders page cookies on disk so a restart can skip the login"""
+        try:
+            # Write then swap so pooled sessions never leave a half-written file
+            temp_path = f"{SWAGELOK_COOKIES_PATH}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump({
+                    "orders_url": self.orders_url,
+                    "cookies": self.driver.get_cookies()
+                }, f)
+            os.replace(temp_path, SWAGELOK_COOKIES_PATH)
+        except Exception as e:
+            pass
 
-        search_button = wait.until(EC.presence_of_element_located((By.ID, "ctl00_MainContentPlaceHolder_btnSearch")))
-        search_button.click()
+    def _restore_session(self):
+        """Open the orders page with saved cookies, returning False if a login is still needed"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
 
-        data = []
-        row_index = 1
-        max_iterations = 50
-        
-        while row_index <= max_iterations:
-            try:
-                order_details_id = f"ctl00_MainContentPlaceHolder_rptResults_ctl{row_index:02d}_trDetails"
-                
-                try:
-                    order_details_element = wait.until(EC.presence_of_element_located((By.ID, order_details_id)))
-                except:
-                    break
-                
-                order_details_text = order_details_element.text.strip()
-                if not order_details_text:
-                    row_index += 1
-                    continue
-                    
-                details = order_details_text.split()
-                
-                if selected_status == "Order - History":
-                    if len(details) >= 8:
-                        order_number = details[0]
-                        
-                        date_index = -1
-                        for i, detail in enumerate(details):
-                            if detail == "History" and i + 1 < len(details):
-                                date_index = i + 1
-                                break
-                        
-                        if date_index > 0 and date_index < len(details):
-                            order_date = details[date_index]
-                            part_number = details[date_index + 1] if date_index + 1 < len(details) else ""
-                            quantity = details[date_index + 2] if date_index + 2 < len(details) else "0"
-                            sales_order = details[date_index + 3] if date_index + 3 < len(details) else ""
-                            
-                            delivery_date = "Delivered"
-                            if date_index + 4 < len(details) and "/" in str(details[date_index + 4]):
-                                delivery_date = details[date_index + 4]
-                            
-                            data.append([order_number, order_date, part_number, quantity, sales_order, delivery_date])
-                
-                elif selected_status == "Order - New, Requires Supplier Action":
-                    if len(details) >= 11:
-                        order_number = details[0]
-                        
-                        date_index = -1
-                        for i, detail in enumerate(details):
-                            if detail == "Action" and i + 1 < len(details):
-                                date_index = i + 1
-                                break
-                        
-                        if date_index > 0 and date_index < len(details):
-                            order_date = details[date_index]
-                            part_number = details[date_index + 1] if date_index + 1 < len(details) else ""
-                            quantity = details[date_index + 2] if date_index + 2 < len(details) else "0"
-                            delivery_date = details[date_index + 3] if date_index + 3 < len(details) else ""
-                            
-                            if not delivery_date or "/" not in delivery_date:
-                                order_dt = parse_date_safely(order_date)
-                                if order_dt:
-                                    delivery_dt = business_days_from(order_dt, 18)
-                                    delivery_date = delivery_dt.strftime("%m/%d/%Y")
-                                else:
-                                    delivery_date = "TBD"
-                            
-                            data.append([order_number, order_date, part_number, quantity, delivery_date])
-                
-                elif selected_status == "Order - Modification, Requires Supplier Action":
-                    if len(details) >= 11:
-                        order_number = details[0]
-                        
-                        date_index = -1
-                        for i, detail in enumerate(details):
-                            if detail == "Action" and i + 1 < len(details):
-                                date_index = i + 1
-                                break
-                        
-                        if date_index > 0 and date_index < len(details):
-                            order_date = details[date_index]
-                            part_number = details[date_index + 1] if date_index + 1 < len(details) else ""
-                            quantity = details[date_index + 2] if date_index + 2 < len(details) else "0"
-                            sales_order = details[date_index + 3] if date_index + 3 < len(details) else ""
-                            
-                            order_dt = parse_date_safely(order_date)
-                            if order_dt:
-                                delivery_dt = business_days_from(order_dt, 18)
-                                delivery_date = delivery_dt.strftime("%m/%d/%Y")
-                            else:
-                                delivery_date = "TBD"
-                            
-                            data.append([order_number, order_date, part_number, quantity, sales_order, delivery_date])
-                
-                else:
-                    # Other statuses - generic parsing
-                    if len(details) >= 10:
-                        order_number = details[0]
-                        
-                        order_date = ""
-                        part_number = ""
-                        quantity = "0"
-                        
-                        for i, detail in enumerate(details):
-                            if "/" in detail and len(detail.split("/")) == 3:
-                                order_date = detail
-                                if i + 1 < len(details):
-                                    part_number = details[i + 1]
-                                if i + 2 < len(details):
-                                    quantity = details[i + 2]
-                                break
-                        
-                        order_dt = parse_date_safely(order_date)
-                        if order_dt:
-                            delivery_dt = business_days_from(order_dt, 18)
-                            delivery_date = delivery_dt.strftime("%m/%d/%Y")
-                        else:
-                            delivery_date = "TBD"
-                        
-                        if order_date and part_number:
-                            data.append([order_number, order_date, part_number, quantity, delivery_date])
+        if not os.path.exists(SWAGELOK_COOKIES_PATH):
+            return False
 
-                row_index += 1
-                
+        driver = self.driver
+        try:
+            with open(SWAGELOK_COOKIES_PATH, 'r') as f:
+                saved_session = json.load(f)
+
+            # Cookies can only be added while on their domain
+            driver.get(saved_session["orders_url"])
+            for cookie in saved_session["cookies"]:
+                driver.add_cookie(cookie)
+            driver.get(saved_session["orders_url"])
+
+            WebDriverWait(driver, 5, poll_frequency=0.2).until(EC.presence_of_element_located((By.ID, "ctl00_MainContentPlaceHolder_cboRequestStatus")))
+            self.orders_url = saved_session["orders_url"]
+            return True
+
+        except Exception as e:
+            return False
+
+    def get_orders_page(self):
+        """Return a driver on a fresh orders page, logging in only when needed"""
+        if self.driver and self.orders_url:
+            try:
+                self.driver.get(self.orders_url)
+                if "login.aspx" not in self.driver.current_url.lower():
+                    return self.driver
             except Exception as e:
-                row_index += 1
-                continue
+                pass
+            # Session expired or browser died - start over
+            self.quit()
 
-        if data and len(data[0]) == 6:  # Has sales order column
-            return ["Order Number", "Order Date", "Part Number", "Quantity", "Sales Order", "Delivery Date"], data
-        elif data and len(data[0]) == 5:  # No sales order column
-            return ["Order Number", "Order Date", "Part Number", "Quantity", "Delivery Date"], data
-        else:
-            return [], []
+        if not self.driver:
+            self.driver = self._create_driver()
+            if not self.driver:
+                return None
 
-    except Exception as e:
-        return [], []
-        
-    finally:
-        if driver:
+        try:
+            if not self._restore_session():
+                self._login()
+            return self.driver
+        except Exception as e:
+            self.quit()
+            return None
+
+    def quit(self):
+        """Close the browser and forget the session"""
+        if self.driver:
             try:
-                driver.quit()
+                self.driver.quit()
             except:
                 pass
+        self.driver = None
+        self.orders_url = None
+
+class BrowserPool:
+    """Lends out logged-in browser sessions, one fetch per session at a time"""
+
+    def __init__(self, username, password, size=2):
+        self.username = username
+        self.password = password
+        self.size = size
+        self.browsers = []
+        self.idle = queue.Queue()
+
+    def initialize(self):
+        """Create the sessions; Chrome itself starts on each session's first fetch"""
+        for _ in range(self.size):
+            browser = SwagelokBrowser(self.username, self.password)
+            self.browsers.append(browser)
+            self.idle.put(browser)
+
+    @contextmanager
+    def acquire(self, timeout=120):
+        """Borrow an idle session, waiting up to timeout seconds for one"""
+        browser = self.idle.get(timeout=timeout)
+        try:
+            yield browser
+        finally:
+            self.release(browser)
+
+    def release(self, browser):
+        """Hand a session back for the next fetch"""
+        self.idle.put(browser)
+
+    def drain(self):
+        """Close every browser in the pool"""
+        for browser in self.browsers:
+            browser.quit()
+
+@st.cache_resource
+def get_browser_pool():
+    """Create the shared browser pool once per server process"""
+    pool = BrowserPool(SWAGELOK_USERNAME, SWAGELOK_PASSWORD, size=2)
+    pool.initialize()
+    atexit.register(pool.drain)
+    return pool
+
+@st.cache_resource
+def get_fetch_executor():
+    """Worker threads that run portal scrapes off the Streamlit script thread"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="swagelok-fetch")
+
+@st.cache_resource
+def get_refresh_counts():
+    """Forced refreshes per status, shared by every session as part of the orders cache key"""
+    return {}
+
+def fetch_swagelok_orders(selected_status):
+    """Fetch orders for a status as a DataFrame, reusing results from the last 5 minutes"""
+    return _fetch_swagelok_orders_cached(selected_status, get_refresh_counts().get(selected_status, 0))
+
+def refresh_order_status(selected_status):
+    """Make the next fetch of one status skip its cached orders, leaving other statuses cached"""
+    refresh_counts = get_refresh_counts()
+    refresh_counts[selected_status] = refresh_counts.get(selected_status, 0) + 1
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_swagelok_orders_cached(selected_status, refresh_count):
+    """Cached scrape; failures raise, so only real results (empty ones too) are kept"""
+    return _fetch_swagelok_orders_uncached(selected_status)
+
+def _prefetch_order_status(selected_status):
+    """Fetch one status for the prefetch, logging a failure rather than ending the run"""
+    try:
+        fetch_swagelok_orders(selected_status)
+    except Exception as e:
+        logger.warning(f"Prefetch of {selected_status} failed: {str(e)}")
+
+def prefetch_order_statuses():
+    """Fetch every status across the browser pool so later status switches are cache hits"""
+    # Leave one pooled session free so a user's own fetch never queues behind the prefetch
+    run_concurrently(_prefetch_order_status, ORDER_STATUSES, max_workers=max(1, get_browser_pool().size - 1))
+
+def _fetch_swagelok_orders_uncached(selected_status):
+    """Fetch orders from Swagelok portal with improved parsing"""
+
+    try:
+        with get_browser_pool().acquire() as browser:
+            try:
+                return _scrape_orders(browser, selected_status)
+            except Exception:
+                # Drop the session so the next fetch on it starts over with a fresh login,
+                # instead of failing the same way on an expired or error page
+                browser.quit()
+                raise
+    except queue.Empty:
+        raise RuntimeError("All portal sessions are busy, please try again")
+
+def _scrape_orders(browser, selected_status):
+    """Run the status search on the orders page and parse the result rows"""
+    # Selenium is only imported once a scrape actually runs
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+
+    driver = browser.get_orders_page()
+    if not driver:
+        raise RuntimeError("Could not open the Swagelok orders page")
+
+    wait = WebDriverWait(driver, 15, poll_frequency=0.2)
+
+    search_button = wait.until(EC.presence_of_element_located((By.ID, "ctl00_MainContentPlaceHolder_btnSearch")))
+    previous_rows = driver.find_elements(By.ID, ORDER_FIRST_ROW_ID)
+
+    # Checkbox, status and search click go over in a single script call
+    if not driver.execute_script(ORDER_SEARCH_SCRIPT, selected_status):
+        raise RuntimeError(f"Status '{selected_status}' is not offered by the portal")
+
+    # The search is done once the page posts back, so an empty result
+    # no longer runs out the full wait on a row that never appears
+    if previous_rows:
+        rows_loaded = EC.staleness_of(previous_rows[0])
+    else:
+        rows_loaded = EC.presence_of_element_located((By.ID, ORDER_FIRST_ROW_ID))
+    
+    try:
+        wait.until(EC.any_of(EC.staleness_of(search_button), rows_loaded))
+    except TimeoutException:
+        # The page still shows the previous search; its rows must not be cached as this status
+        raise RuntimeError(f"The portal did not return results for '{selected_status}' in time")
+
+    # Pull the text of every result row in a single browser round-trip
+    row_texts = driver.execute_script(ORDER_ROWS_SCRIPT)
+
+    return parse_order_rows(row_texts, selected_status)
+
+def _tokens_at(tokens, positions, default):
+    """Pick one token per row at the given column positions, or default past the row's end"""
+    width = tokens.shape[1]
+    picked = tokens[np.arange(len(tokens)), np.clip(positions, 0, width - 1)]
+    present = (positions >= 0) & (positions < width) & pd.notna(picked)
+    return pd.Series(np.where(present, picked, default), dtype=object)
+
+def _first_match(matches):
+    """Column index of each row's first True, or -1 when the row has none"""
+    matches = matches.to_numpy(dtype=bool)
+    return np.where(matches.any(axis=1), matches.argmax(axis=1), -1)
+
+def parse_date_column(date_strings):
+    """Parse a column of date strings, leaving NaT where no date is found"""
+    # Portal dates are MM/DD/YYYY, so parse the column in one pass and only
+    # fall back to the per-value parser for the odd other format
+    parsed = pd.to_datetime(date_strings, format="%m/%d/%Y", errors="coerce")
+    leftover = parsed.isna() & date_strings.astype(str).str.contains(r"\d", regex=True)
+    if leftover.any():
+        parsed[leftover] = pd.to_datetime(date_strings[leftover].astype(str).map(parse_date_safely))
+    return parsed
+
+def estimate_delivery_dates(order_dates):
+    """Default delivery dates 18 business days after each order date"""
+    parsed = parse_date_column(order_dates)
+    valid = parsed.notna().to_numpy()
+    
+    # One busday_offset call for the whole column instead of a walk per row
+    delivery_days = np.busday_offset(
+        parsed[valid].to_numpy().astype("datetime64[D]"), 18, roll='backward'
+    )
+    estimates = pd.Series("TBD", index=order_dates.index, dtype=object)
+    # Reorder numpy's ISO strings instead of running strftime once per date
+    iso_days = pd.Series(np.datetime_as_string(delivery_days, unit='D'), dtype=object)
+    estimates[valid] = (iso_days.str[5:7] + "/" + iso_days.str[8:10] + "/" + iso_days.str[:4]).to_numpy()
+    return estimates
+
+def parse_order_rows(row_texts, selected_status):
+    """Split scraped row text into an orders DataFrame for the selected status"""
+    
+    # One token per column, padded with None for shorter rows
+    token_frame = pd.Series(row_texts, dtype=object).fillna("").str.strip().str.split(expand=True)
+    if token_frame.empty or token_frame.shape[1] == 0:
+        return pd.DataFrame()
+    
+    tokens = token_frame.to_numpy(dtype=object)
+    token_counts = token_frame.notna().sum(axis=1).to_numpy()
+    first_column = np.zeros(len(tokens), dtype=int)
+    
+    if selected_status == "Order - History":
+        date_index = _first_match(token_frame.eq("History")) + 1
+        keep = (token_counts >= 8) & (date_index > 0) & (date_index < token_counts)
+        
+        delivery_dates = _tokens_at(tokens, date_index + 4, "")
+        orders = pd.DataFrame({
+            "Order Number": _tokens_at(tokens, first_column, ""),
+            "Order Date": _tokens_at(tokens, date_index, ""),
+            "Part Number": _tokens_at(tokens, date_index + 1, ""),
+            "Quantity": _tokens_at(tokens, date_index + 2, "0"),
+            "Sales Order": _tokens_at(tokens, date_index + 3, ""),
+            "Delivery Date": delivery_dates.where(delivery_dates.str.contains("/", regex=False), "Delivered")
+        })[keep].reset_index(drop=True)
+    
+    elif selected_status == "Order - New, Requires Supplier Action":
+        date_index = _first_match(token_frame.eq("Action")) + 1
+        keep = (token_counts >= 11) & (date_index > 0) & (date_index < token_counts)
+        
+        orders = pd.DataFrame({
+            "Order Number": _tokens_at(tokens, first_column, ""),
+            "Order Date": _tokens_at(tokens, date_index, ""),
+            "Part Number": _tokens_at(tokens, date_index + 1, ""),
+            "Quantity": _tokens_at(tokens, date_index + 2, "0"),
+            "Delivery Date": _tokens_at(tokens, date_index + 3, "")
+        })[keep].reset_index(drop=True)
+        
+        # Fill in rows without a usable delivery date from their order date
+        missing = ~orders["Delivery Date"].str.contains("/", regex=False)
+        orders.loc[missing, "Delivery Date"] = estimate_delivery_dates(orders.loc[missing, "Order Date"])
+    
+    elif selected_status == "Order - Modification, Requires Supplier Action":
+        date_index = _first_match(token_frame.eq("Action")) + 1
+        keep = (token_counts >= 11) & (date_index > 0) & (date_index < token_counts)
+        
+        orders = pd.DataFrame({
+            "Order Number": _tokens_at(tokens, first_column, ""),
+            "Order Date": _tokens_at(tokens, date_index, ""),
+            "Part Number": _tokens_at(tokens, date_index + 1, ""),
+            "Quantity": _tokens_at(tokens, date_index + 2, "0"),
+            "Sales Order": _tokens_at(tokens, date_index + 3, "")
+        })[keep].reset_index(drop=True)
+        orders["Delivery Date"] = estimate_delivery_dates(orders["Order Date"])
+    
+    else:
+        # Other statuses - the order date is the first token shaped like a date
+        date_index = _first_match(token_frame.apply(lambda column: column.str.count("/").eq(2)))
+        
+        orders = pd.DataFrame({
+            "Order Number": _tokens_at(tokens, first_column, ""),
+            "Order Date": _tokens_at(tokens, date_index, ""),
+            "Part Number": _tokens_at(tokens, np.where(date_index >= 0, date_index + 1, -1), ""),
+            "Quantity": _tokens_at(tokens, np.where(date_index >= 0, date_index + 2, -1), "0")
+        })
+        keep = (token_counts >= 10) & (orders["Order Date"] != "") & (orders["Part Number"] != "")
+        orders = orders[keep.to_numpy()].reset_index(drop=True)
+        orders["Delivery Date"] = estimate_delivery_dates(orders["Order Date"])
+    
+    # Typed once here so the table and the SO workflow don't re-cast per row
+    orders["Quantity"] = pd.to_numeric(orders["Quantity"], errors="coerce").astype("Int64")
+    
+    return orders
 
 # ====== USER MANAGEMENT FUNCTIONS ======
 def create_user_form():
@@ -1311,6 +1797,7 @@ def create_user_form():
                 success, message = user_db.create_user(username, first_name, last_name, password, is_admin)
                 
                 if success:
+                    get_user_list.clear()
                     st.success(f"✅ {message}")
                 else:
                     st.error(f"❌ {message}")
@@ -1387,7 +1874,7 @@ def view_users_form():
         st.info("🔄 Backup auto-updates on user changes")
     
     st.markdown("### 👤 User List")
-    users = user_db.get_all_users()
+    users = get_user_list()
     
     if users:
         df = pd.DataFrame(users, columns=[
@@ -1437,6 +1924,10 @@ def login_form():
                             del st.session_state[key]
                     
                     st.session_state.current_user = result
+                    
+                    # Warm the orders cache for every status while the user looks around
+                    if SWAGELOK_USERNAME and SWAGELOK_PASSWORD:
+                        st.session_state.prefetch_job = get_fetch_executor().submit(prefetch_order_statuses)
                     for key, value in preserved_data.items():
                         st.session_state[key] = value
                     
@@ -1467,6 +1958,69 @@ def display_so_creation_success():
             del st.session_state.so_creation_success
             st.rerun()
 
+def build_display_df(orders_df):
+    """Add row numbers and default delivery dates to a fetched orders frame"""
+    fallback = business_days_from(datetime.now(), 18)
+    
+    # Portal delivery date if there is one, else 18 business days from the
+    # order date, else 18 business days from today - whole columns at a time
+    delivery = parse_date_column(orders_df.iloc[:, -1].astype(str))
+    estimated = parse_date_column(estimate_delivery_dates(orders_df.iloc[:, 1].astype(str)))
+    default_delivery = delivery.fillna(estimated).fillna(pd.Timestamp(fallback)).dt.date
+    
+    return orders_df.assign(**{
+        "No.": np.arange(1, len(orders_df) + 1),
+        "Default Delivery": default_delivery
+    })
+
+def create_pending_sales_orders(pending, delivery_dates):
+    """Create Sales Orders for every pending SS-FV row of the orders table at once"""
+    orders = []
+    skipped = []
+    for idx in pending.index:
+        row = st.session_state.orders_data.loc[idx].tolist()
+        if str(row[2]).strip().startswith("SS-FV"):
+            orders.append((row, delivery_dates[idx]))
+        else:
+            skipped.append(str(row[0]))
+    
+    if skipped:
+        st.warning(f"⚠️ Skipped {', '.join(skipped)} - non SS-FV parts need a manual price, use Execute")
+    if not orders:
+        return
+    
+    # Progress is drawn here on the script thread, between rounds of workers
+    progress_bar = st.progress(0, text=f"Creating {len(orders)} Sales Orders...")
+    results = create_sales_orders_batch(
+        orders,
+        on_progress=lambda done, total: progress_bar.progress(
+            done / total, text=f"Created {done} of {total} Sales Orders..."
+        )
+    )
+    progress_bar.empty()
+    
+    created = [(row, so_number) for (row, _), (so_number, _, _) in results if so_number]
+    failed = [(row, message) for (row, _), (so_number, message, _) in results if not so_number]
+    
+    for (row, _), (_, _, warnings) in results:
+        for warning in warnings:
+            st.warning(f"{row[0]}: {warning}")
+    
+    for row, so_number in created:
+        st.session_state.created_sos[str(row[0]).strip()] = so_number
+    
+    if created:
+        st.session_state.so_creation_success = {
+            'so_number': ", ".join(so_number for _, so_number in created),
+            'order_number': ", ".join(str(row[0]) for row, _ in created),
+            'timestamp': datetime.now()
+        }
+    for row, message in failed:
+        st.error(f"❌ Failed to create SO for {row[0]}: {message}")
+    
+    if created and not failed and not skipped and not any(warnings for _, (_, _, warnings) in results):
+        st.rerun()
+
 def display_main_content():
     """Display the main content (orders table or welcome screen)"""
     
@@ -1490,147 +2044,79 @@ def display_main_content():
         st.write(f"**Found {len(st.session_state.orders_data)} orders:**")
         st.info("💡 **Tip:** All delivery dates are editable - adjust them as needed before creating Sales Orders!")
         
-        columns = st.session_state.orders_data.columns.tolist()
-        
-        if len(columns) == 6:  # Has Sales Order column
-            header_cols = st.columns([0.5, 1.2, 1.2, 2, 1, 1.2, 1.2, 1.5])
-            headers = ["No.", "Order #", "Date", "Part Number", "Qty", "Sales Order", "Delivery", "Action"]
-        else:  # No Sales Order column
-            header_cols = st.columns([0.5, 1.2, 1.2, 2, 1, 1.5, 1.5])
-            headers = ["No.", "Order #", "Date", "Part Number", "Qty", "Delivery", "Action"]
-        
-        for i, header in enumerate(headers):
-            with header_cols[i]:
-                st.markdown(f"**{header}**")
-        
-        st.markdown("---")
-        
-        for idx, row in st.session_state.orders_data.iterrows():
-            if len(columns) == 6:  # Has Sales Order column
-                col1, col2, col3, col4, col5, col6, col7, col8 = st.columns([0.5, 1.2, 1.2, 2, 1, 1.2, 1.2, 1.5])
-                
-                with col1:
-                    st.write(f"{idx + 1}")
-                with col2:
-                    st.write(f"{row.iloc[0]}")  # Order Number
-                with col3:
-                    st.write(f"{row.iloc[1]}")  # Order Date
-                with col4:
-                    part_num = str(row.iloc[2])
-                    if part_num.startswith("SS-FV"):
-                        st.write(f"🧮 {part_num}")
-                    else:
-                        st.write(f"{part_num}")
-                with col5:
-                    st.write(f"{row.iloc[3]}")  # Quantity
-                with col6:
-                    st.write(f"{row.iloc[4]}")  # Sales Order
-                with col7:
-                    delivery_value = str(row.iloc[5])  # Delivery Date
-                    
-                    if delivery_value == "Delivered":
-                        st.write("Delivered")
-                        delivery_date = None
-                    else:
-                        parsed_date = parse_date_safely(delivery_value)
-                        if parsed_date:
-                            default_delivery = parsed_date.date()
-                        else:
-                            order_dt = parse_date_safely(str(row.iloc[1]))
-                            if order_dt:
-                                default_delivery = business_days_from(order_dt, 18).date()
-                            else:
-                                default_delivery = business_days_from(datetime.now(), 18).date()
-                        
-                        delivery_date = st.date_input(
-                            "Delivery",
-                            value=default_delivery,
-                            key=f"delivery_{idx}",
-                            label_visibility="collapsed"
-                        )
-                with col8:
-                    order_number = str(row.iloc[0])
-                    if order_number in st.session_state.created_sos:
-                        so_number = st.session_state.created_sos[order_number]
-                        st.markdown(f'<div class="success-action">✅ SO: {so_number}</div>', unsafe_allow_html=True)
-                    else:
-                        action = st.selectbox(
-                            "Action",
-                            ["Select Action", "Create SO"],
-                            key=f"action_{idx}",
-                            label_visibility="collapsed"
-                        )
-                        if action == "Create SO":
-                            if st.button(f"Execute", key=f"execute_{idx}"):
-                                st.session_state.modal_data = {
-                                    'row': row.tolist(),
-                                    'delivery_date': delivery_date,
-                                    'order_number': order_number
-                                }
-                                st.session_state.show_modal = True
-                                st.rerun()
-            
-            else:  # No Sales Order column (5 columns)
-                col1, col2, col3, col4, col5, col6, col7 = st.columns([0.5, 1.2, 1.2, 2, 1, 1.5, 1.5])
-                
-                with col1:
-                    st.write(f"{idx + 1}")
-                with col2:
-                    st.write(f"{row.iloc[0]}")  # Order Number
-                with col3:
-                    st.write(f"{row.iloc[1]}")  # Order Date
-                with col4:
-                    part_num = str(row.iloc[2])
-                    if part_num.startswith("SS-FV"):
-                        st.write(f"🧮 {part_num}")
-                    else:
-                        st.write(f"{part_num}")
-                with col5:
-                    st.write(f"{row.iloc[3]}")  # Quantity
-                with col6:
-                    delivery_value = str(row.iloc[4])
-                    
-                    parsed_date = parse_date_safely(delivery_value)
-                    if parsed_date:
-                        default_delivery = parsed_date.date()
-                    else:
-                        order_dt = parse_date_safely(str(row.iloc[1]))
-                        if order_dt:
-                            default_delivery = business_days_from(order_dt, 18).date()
-                        else:
-                            default_delivery = business_days_from(datetime.now(), 18).date()
-                    
-                    delivery_date = st.date_input(
-                        "Delivery",
-                        value=default_delivery,
-                        key=f"delivery_{idx}",
-                        label_visibility="collapsed"
+        # Built once per fetched frame and kept in session state, so reruns
+        # skip both the date parsing and hashing the frame for a cache lookup
+        if st.session_state.get('display_source') is not st.session_state.orders_data:
+            st.session_state.display_df = build_display_df(st.session_state.orders_data)
+            st.session_state.display_source = st.session_state.orders_data
+        display_df = st.session_state.display_df
+        has_sales_order = len(st.session_state.orders_data.columns) == 6
+        created_sos = st.session_state.created_sos
+        
+        order_numbers = display_df.iloc[:, 0].astype(str)
+        part_numbers = display_df.iloc[:, 2].astype(str)
+        delivered = st.session_state.orders_data.iloc[:, -1].astype(str) == "Delivered"
+        
+        table = pd.DataFrame({
+            "No.": display_df["No."],
+            "Order #": order_numbers,
+            "Date": display_df.iloc[:, 1],
+            "Part Number": part_numbers.where(~part_numbers.str.startswith("SS-FV"), "🧮 " + part_numbers),
+            "Qty": display_df.iloc[:, 3]
+        })
+        if has_sales_order:
+            table["Sales Order"] = display_df.iloc[:, 4]
+        # Delivered orders keep their label; a date grid column can't lock single cells
+        delivery_text = pd.to_datetime(display_df["Default Delivery"]).dt.strftime("%m/%d/%Y")
+        table["Delivery"] = delivery_text.where(~delivered, "Delivered")
+        table["Created SO"] = order_numbers.map(lambda number: f"✅ {created_sos[number]}" if number in created_sos else "")
+        table["Action"] = "Select Action"
+        
+        # One grid widget for the whole table; edits are sent together on Execute
+        with st.form("orders_form", border=False):
+            edited = st.data_editor(
+                table,
+                column_config={
+                    "Delivery": st.column_config.TextColumn(
+                        "Delivery", help="MM/DD/YYYY", validate=r"^(\d{1,2}/\d{1,2}/\d{4}|Delivered)$"
+                    ),
+                    "Action": st.column_config.SelectboxColumn(
+                        "Action", options=["Select Action", "Create SO"], required=True
                     )
-                
-                with col7:
-                    order_number = str(row.iloc[0])
-                    if order_number in st.session_state.created_sos:
-                        so_number = st.session_state.created_sos[order_number]
-                        st.markdown(f'<div class="success-action">✅ SO: {so_number}</div>', unsafe_allow_html=True)
-                    else:
-                        action = st.selectbox(
-                            "Action",
-                            ["Select Action", "Create SO"],
-                            key=f"action_{idx}",
-                            label_visibility="collapsed"
-                        )
-                        if action == "Create SO":
-                            if st.button(f"Execute", key=f"execute_{idx}"):
-                                st.session_state.modal_data = {
-                                    'row': row.tolist(),
-                                    'delivery_date': delivery_date,
-                                    'order_number': order_number
-                                }
-                                st.session_state.show_modal = True
-                                st.rerun()
-            
-            if idx < len(st.session_state.orders_data) - 1:
-                st.markdown('<hr style="margin: 0.5rem 0; border: none; border-top: 1px solid #e0e0e0;">', unsafe_allow_html=True)
+                },
+                disabled=[column for column in table.columns if column not in ("Delivery", "Action")],
+                hide_index=True,
+                use_container_width=True,
+                key=f"orders_editor_{id(st.session_state.orders_data)}"
+            )
+            col_execute, col_create_all = st.columns([1, 5])
+            with col_execute:
+                execute = st.form_submit_button("Execute", type="primary")
+            with col_create_all:
+                create_all = st.form_submit_button(
+                    "Create All SOs", help='Create every SS-FV order set to "Create SO" in one go'
+                )
+        
+        if execute or create_all:
+            pending = edited[(edited["Action"] == "Create SO") & ~edited["Order #"].isin(list(created_sos))]
+            # Edits to a delivered row's cell are ignored; those orders get no due date from the table
+            delivery_dates = {
+                idx: None if delivered[idx] else parse_date_safely(str(text))
+                for idx, text in pending["Delivery"].items()
+            }
+            if pending.empty:
+                st.warning('Set Action to "Create SO" on an order without a Sales Order first.')
+            elif create_all:
+                create_pending_sales_orders(pending, delivery_dates)
+            else:
+                # The modal handles one order at a time; Execute again for the next one
+                st.session_state.modal_data = {
+                    'row': st.session_state.orders_data.loc[pending.index[0]].tolist(),
+                    'delivery_date': delivery_dates[pending.index[0]],
+                    'order_number': pending["Order #"].iloc[0]
+                }
+                st.session_state.show_modal = True
+                st.rerun()
     
     else:
         # Welcome screen
@@ -1659,6 +2145,19 @@ def display_main_content():
         9. **Click "← Back to Welcome"** to return to this screen when finished
         """)
 
+@st.fragment(run_every=0.5)
+def watch_fetch_job():
+    """Poll the background fetch without re-running the whole page"""
+    fetch_job = st.session_state.get('fetch_job')
+    if not fetch_job:
+        return
+    
+    # Only the finished fetch needs a full rerun to load the orders
+    if fetch_job['future'].done():
+        st.rerun()
+    
+    st.info("⏳ Fetching orders from Swagelok portal...")
+
 # ====== MAIN APPLICATION ======
 def main():
     """Main application entry point"""
@@ -1693,33 +2192,60 @@ def main():
     with st.sidebar:
         st.header("Controls")
         
-        order_status = st.selectbox(
-            "Order Status:",
-            [
-                "Order - New, Requires Supplier Action",
-                "Order - Modification, Requires Supplier Action",
-                "Ack - Sent", 
-                "Ack - Accepted",
-                "Order - History"
-            ]
-        )
+        order_status = st.selectbox("Order Status:", ORDER_STATUSES)
         
         if st.session_state.get('last_order_status') != order_status:
             st.session_state.orders_data = None
             st.session_state.created_sos = {}
             st.session_state.last_order_status = order_status
+            
+            # Once the login prefetch is done, a status switch loads straight from cache
+            prefetch_job = st.session_state.get('prefetch_job')
+            if prefetch_job and prefetch_job.done():
+                st.session_state.fetch_job = {
+                    'status': order_status,
+                    'future': get_fetch_executor().submit(fetch_swagelok_orders, order_status)
+                }
+        
+        force_refresh = st.checkbox("Force refresh", help="Skip orders cached in the last 5 minutes")
         
         if st.button("Fetch Orders", type="primary"):
-            with st.spinner("Fetching orders from Swagelok portal..."):
+            if not (SWAGELOK_USERNAME and SWAGELOK_PASSWORD):
+                st.error("❌ SWAGELOK_USERNAME / SWAGELOK_PASSWORD not found in secrets. Please configure the portal login.")
+            else:
+                if force_refresh:
+                    refresh_order_status(order_status)
+                
+                # Scrape on a worker thread so the page keeps rendering meanwhile
+                st.session_state.fetch_job = {
+                    'status': order_status,
+                    'future': get_fetch_executor().submit(fetch_swagelok_orders, order_status)
+                }
+        
+        fetch_job = st.session_state.get('fetch_job')
+        if fetch_job and fetch_job['future'].done():
+            del st.session_state.fetch_job
+            
+            # Ignore results for a status the user has since switched away from
+            if fetch_job['status'] == order_status:
                 try:
-                    headers, data = fetch_swagelok_orders(order_status)
-                    if data:
-                        st.session_state.orders_data = pd.DataFrame(data, columns=headers)
-                        st.success(f"✅ Fetched {len(data)} orders successfully!")
+                    orders = fetch_job['future'].result()
+                    if not orders.empty:
+                        st.session_state.orders_data = orders
+                        st.success(f"✅ Fetched {len(orders)} orders successfully!")
+                        
+                        # Warm the item cache for these parts in one background request
+                        get_lookup_executor().submit(
+                            warm_item_cache,
+                            get_api_client(),
+                            orders["Part Number"].unique().tolist()
+                        )
                     else:
-                        st.error("❌ No orders found or connection failed")
+                        st.info("ℹ️ No orders found for this status")
                 except Exception as e:
                     st.error(f"❌ Error fetching orders: {str(e)}")
+        elif fetch_job:
+            watch_fetch_job()
         
         st.markdown("---")
         